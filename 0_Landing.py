@@ -1,24 +1,15 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+from draft_data import (build_pipeline_graph, pipeline_matrix, top_feeder_colleges, top_destination_teams,
+                        team_pipeline_similarity, grouped_position_round_counts, add_conference, POSITION_SCHEMES)
+from lean_render import lean_render_enabled, show_chart, payload_report
+from precompute import prefetch, view_result
 
-# Load data
+# Load data with each pick's college conference
 DATA_PATH = "draft_picks.csv"
-CONF_PATH = "conferences.csv"
-df = pd.read_csv(DATA_PATH)
-conf_df = pd.read_csv(CONF_PATH)
-
-# Create mapping from college to conference
-college_to_conf = conf_df.set_index("Team")["Conference"].to_dict()
-df["conference"] = df["college"].map(college_to_conf).fillna("Non-Power Conference")
-
-# Group similar positions
-# position_map = {
-#     "OT": "OL", "OG": "OL", "C": "OL",
-#     "P": "ST", "K": "ST",
-#     "DT": "DL"
-# }
-# df["position"] = df["position"].replace(position_map)
+df = add_conference(pd.read_csv(DATA_PATH))
 
 # Page config
 st.set_page_config(page_title="NFL Draft Landing Page", layout="wide")
@@ -55,7 +46,13 @@ if not selected_years:
     st.sidebar.error("Please select at least one year.")
     st.stop()
 
+st.sidebar.markdown("**Position Grouping**")
+position_scheme = st.sidebar.radio("Position Grouping", POSITION_SCHEMES, label_visibility="collapsed")
+lean_render = lean_render_enabled()
+
 df_filtered = df[df["season"].isin(selected_years)]
+position_counts = grouped_position_round_counts(position_scheme)
+position_counts = position_counts[position_counts["season"].isin(selected_years)]
 
 # Summary
 st.markdown("### Summary")
@@ -71,18 +68,20 @@ st.subheader("Position Breakdown")
 left_col, right_col = st.columns([1, 1])
 
 with left_col:
-    pos_counts = df_filtered.groupby("position").size().reset_index(name="count").sort_values("count", ascending=False)
+    pos_counts = position_counts.groupby("position", observed=True)["count"].sum().reset_index().sort_values("count", ascending=False)
+    pos_counts["position"] = pos_counts["position"].astype(str)
     fig_pos = px.bar(pos_counts, x="position", y="count", title="Number of Players Drafted by Position",
                      color_discrete_sequence=[ACCENT_COLOR])
     fig_pos.update_layout(font_color=TEXT_COLOR, plot_bgcolor=BACKGROUND_COLOR, paper_bgcolor=BACKGROUND_COLOR)
-    st.plotly_chart(fig_pos, use_container_width=True)
+    show_chart(fig_pos, "position_bar", lean=lean_render)
 
 with right_col:
-    pos_round = df_filtered[df_filtered["round"] != 0].groupby(["round", "position"]).size().reset_index(name="count")
+    pos_round = position_counts[position_counts["round"] != 0].groupby(["round", "position"], observed=True)["count"].sum().reset_index()
+    pos_round["position"] = pos_round["position"].astype(str)
 
     round1_sort = pos_round[pos_round["round"] == 1].sort_values("count", ascending=False)
     ordered_positions = round1_sort["position"].tolist()
-    other_positions = [pos for pos in df_filtered["position"].unique() if pos not in ordered_positions]
+    other_positions = [pos for pos in pos_counts["position"].astype(str) if pos not in ordered_positions]
     final_order = ordered_positions + other_positions
 
     fig_heat = px.imshow(
@@ -93,9 +92,29 @@ with right_col:
         title="Players Drafted by Position and Round"
     )
     fig_heat.update_layout(font_color=TEXT_COLOR, plot_bgcolor=BACKGROUND_COLOR, paper_bgcolor=BACKGROUND_COLOR)
-    st.plotly_chart(fig_heat, use_container_width=True)
+    show_chart(fig_heat, "position_heatmap", lean=lean_render)
 
 # Colleges and Conferences
+def conference_hover_text(df_filtered):
+    df_filtered = df_filtered.assign(conference=df_filtered["conference"].astype(str),
+                                     college=df_filtered["college"].astype(str))
+
+    hover_df = (
+        df_filtered.groupby(["conference", "college"])
+        .size()
+        .reset_index(name="count")
+    )
+
+    return (
+        hover_df.groupby("conference")
+        .apply(lambda x: "<br>".join(f"{row['college']} ({row['count']})" for _, row in x.iterrows()))
+        .reset_index(name="colleges")
+    )
+
+# Start the conference hover aggregation in the background so the Conference view is ready when toggled
+conference_hover_request = (("conference_hover", tuple(selected_years)), conference_hover_text, df_filtered)
+prefetch(conference_hover_request)
+
 st.subheader("Top Sources of Draftees")
 toggle_option = st.radio("View by:", ["College", "Conference"], horizontal=True)
 
@@ -106,26 +125,13 @@ if toggle_option == "College":
                  title="Top Colleges by Number of Drafted Players",
                  color_discrete_sequence=[PRIMARY_COLOR])
     fig.update_layout(font_color=TEXT_COLOR, plot_bgcolor=BACKGROUND_COLOR, paper_bgcolor=BACKGROUND_COLOR)
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig, "top_colleges", lean=lean_render)
 else:
     top_confs = df_filtered["conference"].value_counts().reset_index()
     top_confs.columns = ["conference", "count"]
     top_confs = top_confs[top_confs["conference"] != "Other"]
 
-    df_filtered["conference"] = df_filtered["conference"].astype(str)
-    df_filtered["college"] = df_filtered["college"].astype(str)
-
-    hover_df = (
-        df_filtered.groupby(["conference", "college"])
-        .size()
-        .reset_index(name="count")
-    )
-
-    hover_text_df = (
-        hover_df.groupby("conference")
-        .apply(lambda x: "<br>".join(f"{row['college']} ({row['count']})" for _, row in x.iterrows()))
-        .reset_index(name="colleges")
-    )
+    hover_text_df = view_result(*conference_hover_request, message="Collecting colleges by conference...")
 
     top_confs = top_confs.merge(hover_text_df, on="conference", how="left")
 
@@ -135,4 +141,53 @@ else:
                  hover_data={"colleges": True, "count": True, "conference": False})
     fig.update_traces(hovertemplate="<b>%{y}</b><br>count=%{x}<br>%{customdata[0]}")
     fig.update_layout(font_color=TEXT_COLOR, plot_bgcolor=BACKGROUND_COLOR, paper_bgcolor=BACKGROUND_COLOR)
-    st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
+    show_chart(fig, "top_conferences", lean=lean_render)
+
+# College-to-Team Pipelines
+st.markdown("---")
+st.subheader("College-to-Team Pipelines")
+pipeline_graph = build_pipeline_graph()
+pipeline = pipeline_matrix(pipeline_graph, selected_years)
+
+pipeline_option = st.radio("Explore by:", ["Team", "College"], horizontal=True)
+sankey_col, similar_col = st.columns([2, 1])
+
+if pipeline_option == "Team":
+    active_teams = pipeline_graph["teams"][pipeline.getnnz(axis=0) > 0].tolist()
+    focus = sankey_col.selectbox("Team", active_teams)
+    links = top_feeder_colleges(pipeline_graph, pipeline, focus, n=12)
+    sources, targets = links["college"].tolist(), [focus] * len(links)
+else:
+    college_totals = pd.Series(pipeline.sum(axis=1).A1, index=pipeline_graph["colleges"])
+    active_colleges = college_totals[college_totals > 0].sort_values(ascending=False).index.tolist()
+    focus = sankey_col.selectbox("College", active_colleges)
+    links = top_destination_teams(pipeline_graph, pipeline, focus, n=12)
+    sources, targets = [focus] * len(links), links["team"].tolist()
+
+node_labels = list(dict.fromkeys(sources + targets))
+node_index = {label: i for i, label in enumerate(node_labels)}
+fig_pipeline = go.Figure(go.Sankey(
+    node=dict(label=node_labels, color=ACCENT_COLOR, pad=12, thickness=14),
+    link=dict(
+        source=[node_index[label] for label in sources],
+        target=[node_index[label] for label in targets],
+        value=links["count"].tolist(),
+        color="rgba(252, 165, 165, 0.35)"
+    )
+))
+fig_pipeline.update_layout(title=f"Draft Pipeline: {focus}", font_color=TEXT_COLOR,
+                           plot_bgcolor=BACKGROUND_COLOR, paper_bgcolor=BACKGROUND_COLOR, height=500)
+show_chart(fig_pipeline, "pipeline_sankey", lean=lean_render, container=sankey_col)
+
+if pipeline_option == "Team":
+    similarity = team_pipeline_similarity(pipeline_graph, pipeline)[focus].drop(focus)
+    similar_teams = similarity[similarity > 0].sort_values(ascending=False).head(10).reset_index()
+    similar_teams.columns = ["team", "similarity"]
+    fig_similar = px.bar(similar_teams, x="similarity", y="team", orientation="h",
+                         title="Most Similar College Pipelines",
+                         color_discrete_sequence=[PRIMARY_COLOR])
+    fig_similar.update_layout(font_color=TEXT_COLOR, plot_bgcolor=BACKGROUND_COLOR, paper_bgcolor=BACKGROUND_COLOR,
+                              yaxis=dict(autorange="reversed"), height=500)
+    show_chart(fig_similar, "pipeline_similarity", lean=lean_render, container=similar_col)
+
+payload_report()
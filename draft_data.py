@@ -0,0 +1,306 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+from scipy import sparse
+
+# Shared data helpers used across pages
+DATA_PATH = "draft_picks.csv"
+CONF_PATH = "conferences.csv"
+
+# Drafts at least this many seasons before the latest one count as complete careers
+COMPLETE_CAREER_SEASONS = 10
+# Width (in picks) of the triangular kernel used to smooth W_AV before the monotone fit
+PICK_SMOOTHING_WINDOW = 9
+
+
+@st.cache_data(show_spinner=False)
+def load_draft_picks():
+    return pd.read_csv(DATA_PATH)
+
+
+# Current franchises, keyed by the team code they use today
+FRANCHISE_NAMES = {
+    "ARI": "Arizona Cardinals", "ATL": "Atlanta Falcons", "BAL": "Baltimore Ravens", "BUF": "Buffalo Bills",
+    "CAR": "Carolina Panthers", "CHI": "Chicago Bears", "CIN": "Cincinnati Bengals", "CLE": "Cleveland Browns",
+    "DAL": "Dallas Cowboys", "DEN": "Denver Broncos", "DET": "Detroit Lions", "GNB": "Green Bay Packers",
+    "HOU": "Houston Texans", "IND": "Indianapolis Colts", "JAX": "Jacksonville Jaguars", "KAN": "Kansas City Chiefs",
+    "LAC": "Los Angeles Chargers", "LAR": "Los Angeles Rams", "MIA": "Miami Dolphins", "MIN": "Minnesota Vikings",
+    "NWE": "New England Patriots", "NOR": "New Orleans Saints", "NYG": "New York Giants", "NYJ": "New York Jets",
+    "LVR": "Las Vegas Raiders", "PHI": "Philadelphia Eagles", "PIT": "Pittsburgh Steelers",
+    "SEA": "Seattle Seahawks", "SFO": "San Francisco 49ers", "TAM": "Tampa Bay Buccaneers",
+    "TEN": "Tennessee Titans", "WAS": "Washington Commanders"
+}
+# franchise_id is a franchise's position in this list
+FRANCHISES = sorted(FRANCHISE_NAMES)
+# Franchises whose logo file is not named after their team code
+FRANCHISE_LOGOS = {"LVR": "LV"}
+
+# Historical team codes: (code, first season, last season, franchise). Codes are reused
+# (STL, HOU, BAL), so the season decides the franchise.
+RELOCATIONS = [
+    ("STL", 1980, 1987, "ARI"), ("PHO", 1988, 1993, "ARI"),
+    ("BAL", 1980, 1983, "IND"),
+    ("HOU", 1980, 1996, "TEN"),
+    ("RAM", 1980, 1994, "LAR"), ("STL", 1995, 2015, "LAR"),
+    ("OAK", 1980, 1981, "LVR"), ("RAI", 1982, 1994, "LVR"), ("OAK", 1995, 2019, "LVR"),
+    ("SDG", 1980, 2016, "LAC")
+]
+
+
+# (team code x season) -> franchise_id table, built once so rows resolve with one array gather
+@st.cache_data(show_spinner=False)
+def franchise_lookup():
+    seasons = load_draft_picks()["season"]
+    codes = set(load_draft_picks()["team"].dropna()) | set(FRANCHISES) | {code for code, *_ in RELOCATIONS}
+    codes = pd.Index(sorted(codes))
+    first_season = min(int(seasons.min()), min(start for _, start, _, _ in RELOCATIONS))
+    n_seasons = int(seasons.max()) - first_season + 1
+
+    table = np.full((len(codes), n_seasons), -1, dtype=np.int16)
+    for franchise_id, code in enumerate(FRANCHISES):
+        table[codes.get_loc(code), :] = franchise_id
+    for code, start, end, franchise in RELOCATIONS:
+        table[codes.get_loc(code), start - first_season:end - first_season + 1] = FRANCHISES.index(franchise)
+    return codes, first_season, table
+
+
+# Adds franchise_id (int, -1 if unknown) and franchise (current team code) columns
+def add_franchise(df):
+    codes, first_season, table = franchise_lookup()
+    rows = codes.get_indexer(df["team"])
+    cols = (df["season"].to_numpy() - first_season).clip(0, table.shape[1] - 1)
+    ids = np.where(rows >= 0, table[rows, cols], -1)
+    franchise = np.where(ids >= 0, np.array(FRANCHISES)[ids], df["team"].to_numpy())
+    return df.assign(franchise_id=ids, franchise=franchise)
+
+
+def franchise_logo_path(franchise, logo_dir="logos/teams"):
+    return os.path.join(logo_dir, f"{FRANCHISE_LOGOS.get(franchise, franchise)}.png")
+
+
+def _isotonic_decreasing(values, weights):
+    # Pool adjacent violators on the negated values gives a non-increasing fit
+    block_vals, block_weights, block_sizes = [], [], []
+    for val, weight in zip(-values, weights):
+        size = 1
+        while block_vals and block_vals[-1] > val:
+            prev_val, prev_weight, prev_size = block_vals.pop(), block_weights.pop(), block_sizes.pop()
+            val = (prev_val * prev_weight + val * weight) / (prev_weight + weight)
+            weight += prev_weight
+            size += prev_size
+        block_vals.append(val)
+        block_weights.append(weight)
+        block_sizes.append(size)
+    return -np.repeat(block_vals, block_sizes)
+
+
+# College -> conference; colleges listed under two conferences keep their last listing
+@st.cache_data(show_spinner=False)
+def college_conferences():
+    return pd.read_csv(CONF_PATH).set_index("Team")["Conference"].to_dict()
+
+
+def add_conference(df):
+    return df.assign(conference=df["college"].map(college_conferences()).fillna("Non-Power Conference"))
+
+
+# Expected career W_AV for each overall pick, indexed directly by pick number (index 0 unused)
+@st.cache_data(show_spinner=False)
+def expected_wav_by_pick():
+    df = load_draft_picks()
+    df = df[(df["round"] > 0) & df["pick"].notna()]
+    complete = df[df["season"] <= df["season"].max() - COMPLETE_CAREER_SEASONS]
+
+    size = int(df["pick"].max()) + 1
+    picks = complete["pick"].astype(int).to_numpy()
+    # Players without a W_AV never accrued any value
+    wav_sums = np.bincount(picks, weights=complete["w_av"].fillna(0).to_numpy(), minlength=size)
+    counts = np.bincount(picks, minlength=size).astype(float)
+
+    # Triangular window that shrinks near the first and last picks so it stays centered;
+    # a one-sided window at pick 1 would average in the much lower values of later picks
+    picks_axis = np.arange(size)
+    half_widths = np.minimum.reduce([np.full(size, PICK_SMOOTHING_WINDOW // 2),
+                                     picks_axis - 1, size - 1 - picks_axis])
+    smooth_sums, smooth_counts = np.zeros(size), np.zeros(size)
+    for half in range(PICK_SMOOTHING_WINDOW // 2 + 1):
+        at_width = half_widths == half
+        kernel = np.bartlett(2 * half + 3)[1:-1]
+        smooth_sums[at_width] = np.convolve(wav_sums, kernel, mode="same")[at_width]
+        smooth_counts[at_width] = np.convolve(counts, kernel, mode="same")[at_width]
+    smooth_sums, smooth_counts = smooth_sums[1:], smooth_counts[1:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        smoothed = pd.Series(smooth_sums / smooth_counts).ffill().bfill().to_numpy()
+
+    expected = np.full(size, np.nan)
+    expected[1:] = _isotonic_decreasing(smoothed, np.maximum(smooth_counts, 1e-9))
+    return expected
+
+
+# Latest draft season whose careers are treated as complete; later drafts are still accruing value
+def last_complete_season():
+    return load_draft_picks()["season"].max() - COMPLETE_CAREER_SEASONS
+
+
+# Adds expected_wav and surplus_wav (actual minus expected W_AV) through an array lookup on pick.
+# Drafts within COMPLETE_CAREER_SEASONS are still accruing value, so their surplus is left as NaN.
+def add_surplus_value(df):
+    expected = expected_wav_by_pick()
+    picks = df["pick"].fillna(0).astype(int).clip(0, len(expected) - 1).to_numpy()
+    df = df.assign(expected_wav=expected[picks])
+    df["surplus_wav"] = (df["w_av"].fillna(0) - df["expected_wav"]).where(df["season"] <= last_complete_season())
+    return df
+
+
+def team_surplus(df):
+    return (
+        df.dropna(subset=["surplus_wav"])
+        .groupby("franchise_id")
+        .agg(total_surplus=("surplus_wav", "sum"), avg_surplus=("surplus_wav", "mean"))
+        .reset_index()
+    )
+
+
+# College -> franchise pick counts as one sparse (colleges x franchises) matrix per season, built once
+@st.cache_resource(show_spinner=False)
+def build_pipeline_graph():
+    df = add_franchise(load_draft_picks())
+    df = df[(df["round"] > 0) & df["college"].notna() & (df["franchise_id"] >= 0)]
+    college_codes, colleges = pd.factorize(df["college"], sort=True)
+    team_codes, teams = df["franchise_id"].to_numpy(), pd.Index(FRANCHISES)
+    shape = (len(colleges), len(teams))
+
+    by_season = {}
+    for season, rows in df.groupby("season").indices.items():
+        by_season[season] = sparse.csr_matrix(
+            (np.ones(len(rows)), (college_codes[rows], team_codes[rows])), shape=shape
+        )
+    return {
+        "colleges": colleges,
+        "teams": teams,
+        "college_index": {college: i for i, college in enumerate(colleges)},
+        "team_index": {team: i for i, team in enumerate(teams)},
+        "by_season": by_season,
+    }
+
+
+def pipeline_matrix(graph, seasons):
+    shape = (len(graph["colleges"]), len(graph["teams"]))
+    matrices = [graph["by_season"][season] for season in seasons if season in graph["by_season"]]
+    return sum(matrices, sparse.csr_matrix(shape)).tocsr()
+
+
+def _top_entries(positions, counts, labels, n, label_name):
+    order = np.argsort(-counts, kind="stable")[:n]
+    return pd.DataFrame({label_name: labels[positions[order]], "count": counts[order].astype(int)})
+
+
+def top_feeder_colleges(graph, matrix, team, n=10):
+    if team not in graph["team_index"]:
+        return pd.DataFrame(columns=["college", "count"])
+    column = matrix.tocsc()[:, graph["team_index"][team]].tocoo()
+    return _top_entries(column.row, column.data, graph["colleges"], n, "college")
+
+
+def top_destination_teams(graph, matrix, college, n=10):
+    if college not in graph["college_index"]:
+        return pd.DataFrame(columns=["team", "count"])
+    row = matrix[graph["college_index"][college], :].tocoo()
+    return _top_entries(row.col, row.data, graph["teams"], n, "team")
+
+
+# Cosine similarity between teams' college pipelines (teams x teams)
+def team_pipeline_similarity(graph, matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0))).ravel()
+    norms[norms == 0] = 1
+    overlap = (matrix.T @ matrix).toarray()
+    return pd.DataFrame(overlap / np.outer(norms, norms), index=graph["teams"], columns=graph["teams"])
+
+
+# Position grouping schemes, applied by remapping the position categories rather than the rows
+POSITION_GROUPS = {
+    "OT": "OL", "OG": "OL", "T": "OL", "G": "OL", "C": "OL",
+    "P": "ST", "K": "ST", "LS": "ST", "KR": "ST",
+    "DT": "DL", "NT": "DL", "EDGE": "DE",
+    "OLB": "LB", "ILB": "LB",
+    "CB": "DB", "S": "DB", "SAF": "DB", "FS": "DB"
+}
+SIDE_NAMES = {"O": "Offense", "D": "Defense", "S": "Special Teams"}
+POSITION_SCHEMES = ["Raw", "Grouped", "Offense/Defense"]
+
+
+@st.cache_data(show_spinner=False)
+def position_scheme_mapping(scheme):
+    positions = load_draft_picks()["position"].dropna().unique()
+    if scheme == "Raw":
+        return {pos: pos for pos in positions}
+    if scheme == "Grouped":
+        return {pos: POSITION_GROUPS.get(pos, pos) for pos in positions}
+
+    # Each position sits on a single side; fall back to its group's side where the side is missing
+    df = load_draft_picks()
+    known = df[df["side"].isin(SIDE_NAMES.keys())]
+    side_of = known.groupby("position")["side"].agg(lambda sides: sides.mode().iloc[0])
+    side_of_group = side_of.groupby(side_of.index.map(lambda pos: POSITION_GROUPS.get(pos, pos))).first()
+    mapping = {}
+    for pos in positions:
+        side = side_of.get(pos, side_of_group.get(POSITION_GROUPS.get(pos, pos)))
+        mapping[pos] = SIDE_NAMES.get(side, "Other")
+    return mapping
+
+
+def apply_position_scheme(positions, scheme):
+    positions = positions.astype("category")
+    mapping = position_scheme_mapping(scheme)
+    old_categories = positions.cat.categories
+    new_categories = pd.Index([mapping.get(pos, pos) for pos in old_categories])
+    groups = new_categories.unique()
+    # Translate each old category code to its group's code, then gather over the codes
+    code_map = np.append(groups.get_indexer(new_categories), -1)
+    codes = code_map[positions.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=groups), index=positions.index, name=positions.name)
+
+
+# Pick counts by season, round and raw position; small enough to regroup for any scheme
+@st.cache_data(show_spinner=False)
+def position_round_counts():
+    df = load_draft_picks()
+    return df.groupby(["season", "round", "position"]).size().reset_index(name="count")
+
+
+@st.cache_data(show_spinner=False)
+def grouped_position_round_counts(scheme):
+    counts = position_round_counts()
+    counts["position"] = apply_position_scheme(counts["position"], scheme)
+    return counts.groupby(["season", "round", "position"], observed=True)["count"].sum().reset_index()
+
+
+# Per-season aggregates for the trends page: one row per season, one column per category
+@st.cache_data(show_spinner=False)
+def season_conference_counts():
+    df = add_conference(load_draft_picks())
+    return df.groupby(["season", "conference"]).size().unstack(fill_value=0)
+
+
+# W_AV sums and pick counts per (season, round). Players without a W_AV never accrued any value,
+# except in seasons with no W_AV reported at all yet, which get a count of zero
+@st.cache_data(show_spinner=False)
+def season_round_wav():
+    df = load_draft_picks()
+    df = df[df["round"] > 0]
+    reported = df.groupby("season")["w_av"].transform("count") > 0
+    keys = [df["season"], df["round"]]
+    wav_sums = df["w_av"].fillna(0).groupby(keys).sum().unstack(fill_value=0)
+    wav_counts = reported.groupby(keys).sum().unstack(fill_value=0)
+    return wav_sums, wav_counts
+
+
+# Trailing rolling sums from a single cumulative sum, so any window costs O(seasons x columns)
+def rolling_sum(wide, window):
+    wide = wide.reindex(range(int(wide.index.min()), int(wide.index.max()) + 1), fill_value=0)
+    values = wide.to_numpy(dtype=float)
+    cumulative = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - window, 0)
+    return pd.DataFrame(cumulative[end] - cumulative[start], index=wide.index, columns=wide.columns)
@@ -0,0 +1,127 @@
+import streamlit as st
+import numpy as np
+import plotly
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.basedatatypes import BasePlotlyType
+import logging
+
+# "Lean render" trims the figure JSON sent to the browser: rounded numbers, integer counts,
+# no unused customdata, and WebGL/text markers in place of embedded logo images.
+LEAN_DECIMALS = 2
+
+# Serialized size budgets (bytes) per chart in lean mode, about 15% above the measured lean size
+PAYLOAD_BUDGETS = {
+    "position_bar": 4_800,
+    "position_heatmap": 5_700,
+    "top_colleges": 4_900,
+    "top_conferences": 7_800,
+    "pipeline_sankey": 4_400,
+    "pipeline_similarity": 4_900,
+    "team_top_impact": 4_800,
+    "team_comparison": 5_100,
+    "trend_position_share": 14_400,
+    "trend_round1_mix": 14_300,
+    "trend_conference_share": 15_100,
+    "trend_wav_by_round": 15_500,
+    "efficiency": 22_800,
+    "efficiency_animated": 227_800,
+}
+
+logger = logging.getLogger(__name__)
+
+# plotly>=6 sends numpy arrays as typed binary, so narrower dtypes shrink the payload;
+# plotly 5 writes them as JSON text, where float32 would only add digits
+_BINARY_ARRAYS = int(plotly.__version__.split(".")[0]) >= 6
+
+
+# Shared across pages: the checkbox state is kept under a plain session key
+def lean_render_enabled():
+    if "lean_render" not in st.session_state:
+        st.session_state["lean_render"] = False
+    st.session_state["lean_render"] = st.sidebar.checkbox(
+        "Lean render", value=st.session_state["lean_render"],
+        help="Send smaller charts to the browser: rounded values and no embedded logos."
+    )
+    # Every page calls this before drawing charts, so the payload report only covers the current run
+    st.session_state["payload_sizes"] = {}
+    return st.session_state["lean_render"]
+
+
+_INT_DTYPES = [np.int8, np.uint8, np.int16, np.uint16, np.int32]
+
+
+def _narrow_ints(values):
+    if values.size == 0:
+        return values.astype(np.int32)
+    low, high = values.min(), values.max()
+    for dtype in _INT_DTYPES:
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+            return values.astype(dtype)
+    return values
+
+
+def _lean_array(values, decimals):
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+        finite = values[np.isfinite(values)]
+        if finite.size == values.size and np.array_equal(finite, np.round(finite)):
+            return _narrow_ints(values)
+        values = np.round(values, decimals)
+        return values.astype(np.float32) if _BINARY_ARRAYS else values
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        return _narrow_ints(values)
+    if isinstance(values, (list, tuple)) and values and all(isinstance(v, (float, type(None))) for v in values):
+        return [None if v is None else round(v, decimals) for v in values]
+    return values
+
+
+# Works on the trace objects themselves: to_dict()/to_plotly_json() already hold plotly>=6's
+# base64 "bdata" form, where the dtype can no longer be changed
+def _lean_props(obj, decimals):
+    for key in list(obj.to_plotly_json()):
+        value = obj[key]
+        if isinstance(value, BasePlotlyType):
+            _lean_props(value, decimals)
+            continue
+        lean_value = _lean_array(value, decimals)
+        if lean_value is not value:
+            obj[key] = lean_value
+
+
+def lean_figure(fig, decimals=LEAN_DECIMALS):
+    fig = go.Figure(fig)
+    traces = list(fig.data) + [trace for frame in fig.frames for trace in (frame.data or [])]
+    for trace in traces:
+        props = trace.to_plotly_json()
+        templates = str(props.get("hovertemplate", "")) + str(props.get("texttemplate", ""))
+        if "customdata" in props and "customdata" not in templates:
+            trace.customdata = None
+        _lean_props(trace, decimals)
+    return fig
+
+
+def figure_payload_bytes(fig):
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
+
+
+# Renders a chart, applying lean mode and recording its serialized size for the sidebar report
+def show_chart(fig, name, lean=False, container=st):
+    if lean:
+        fig = lean_figure(fig)
+    size = figure_payload_bytes(fig)
+    st.session_state.setdefault("payload_sizes", {})[name] = size
+    budget = PAYLOAD_BUDGETS.get(name)
+    if lean and budget is not None and size > budget:
+        logger.warning("Chart %s payload is %d bytes, over its %d byte budget", name, size, budget)
+    container.plotly_chart(fig, use_container_width=True)
+
+
+def payload_report():
+    sizes = st.session_state.get("payload_sizes", {})
+    if not sizes:
+        return
+    with st.sidebar.expander("Chart payload sizes"):
+        for name, size in sorted(sizes.items()):
+            budget = PAYLOAD_BUDGETS.get(name)
+            limit = f" / {budget / 1000:.0f} KB" if budget else ""
+            st.markdown(f"`{name}`: {size / 1000:.1f} KB{limit}")
@@ -0,0 +1,121 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import hashlib
+import os
+from draft_data import DATA_PATH, COMPLETE_CAREER_SEASONS, load_draft_picks, apply_position_scheme
+
+# Career-outcome model: L2 logistic regressions on pick, position group and combine metrics.
+# Train offline with `python outcome_model.py`; pages only load the saved artifact and score.
+MODEL_DIR = "models"
+MODEL_VERSION = 1
+COMBINE_COLUMNS = ["Height_in", "Wt", "40yd", "Vertical", "Bench", "Broad Jump", "3Cone", "Shuttle"]
+# Outcome name -> (column, minimum value counted as reaching the outcome)
+OUTCOMES = {"starter": ("seasons_started", 3), "pro_bowl": ("probowls", 1)}
+L2_PENALTY = 1.0
+
+
+def data_hash(path=DATA_PATH):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def artifact_path(digest):
+    return os.path.join(MODEL_DIR, f"outcome_model_v{MODEL_VERSION}_{digest}.npz")
+
+
+def build_features(df, model):
+    n = len(df)
+    log_pick = np.log(df["pick"].fillna(df["pick"].max()).clip(lower=1).to_numpy(dtype=float))
+
+    positions = pd.Categorical(apply_position_scheme(df["position"], "Grouped").astype(object),
+                               categories=model["positions"])
+    one_hot = np.eye(len(model["positions"]) + 1)[positions.codes][:, :-1]
+
+    combine = df[COMBINE_COLUMNS].to_numpy(dtype=float)
+    missing = np.isnan(combine)
+    combine = np.where(missing, 0, (combine - model["means"]) / model["stds"])
+    return np.column_stack([np.ones(n), log_pick, one_hot, combine, missing.astype(float)])
+
+
+def _fit_logistic(X, y, penalty=L2_PENALTY, iterations=50):
+    # Newton-Raphson on the penalized log-likelihood; the intercept is not penalized
+    ridge = np.full(X.shape[1], penalty)
+    ridge[0] = 0
+    weights = np.zeros(X.shape[1])
+    for _ in range(iterations):
+        p = 1 / (1 + np.exp(-X @ weights))
+        grad = X.T @ (p - y) + ridge * weights
+        hess = (X.T * (p * (1 - p))) @ X + np.diag(ridge)
+        step = np.linalg.solve(hess, grad)
+        weights -= step
+        if np.abs(step).max() < 1e-6:
+            break
+    return weights
+
+
+def train_outcome_model(df, digest):
+    df = df[(df["round"] > 0) & df["pick"].notna()]
+    df = df[df["season"] <= df["season"].max() - COMPLETE_CAREER_SEASONS]
+
+    combine = df[COMBINE_COLUMNS].to_numpy(dtype=float)
+    stds = np.nanstd(combine, axis=0)
+    model = {
+        "version": MODEL_VERSION,
+        "data_hash": digest,
+        "positions": sorted(apply_position_scheme(df["position"], "Grouped").dropna().unique()),
+        "means": np.nanmean(combine, axis=0),
+        "stds": np.where(stds > 0, stds, 1),
+    }
+
+    X = build_features(df, model)
+    for name, (col, threshold) in OUTCOMES.items():
+        y = (df[col].fillna(0) >= threshold).to_numpy(dtype=float)
+        model[f"weights_{name}"] = _fit_logistic(X, y)
+    return model
+
+
+def save_outcome_model(model, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    arrays = {key: np.asarray(value) for key, value in model.items()}
+    np.savez(path, **arrays)
+
+
+def read_outcome_model(path):
+    with np.load(path, allow_pickle=False) as artifact:
+        model = {key: artifact[key] for key in artifact.files}
+    model["positions"] = model["positions"].tolist()
+    return model
+
+
+# Loads the committed artifact for the current data; pages never train the model themselves
+@st.cache_resource(show_spinner=False)
+def load_outcome_model():
+    path = artifact_path(data_hash())
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"No outcome model found at {path} for the current draft_picks.csv. "
+            "Run `python outcome_model.py` to train it and commit the file it writes."
+        )
+    return read_outcome_model(path)
+
+
+def score_outcomes(df, model):
+    X = build_features(df, model)
+    weights = np.column_stack([model[f"weights_{name}"] for name in OUTCOMES])
+    probs = 1 / (1 + np.exp(-X @ weights))
+    return pd.DataFrame(probs, columns=[f"p_{name}" for name in OUTCOMES], index=df.index)
+
+
+# Outcome probabilities for every pick, scored in one batch
+@st.cache_data(show_spinner=False)
+def scored_draft_picks():
+    return score_outcomes(load_draft_picks(), load_outcome_model())
+
+
+if __name__ == "__main__":
+    digest = data_hash()
+    model = train_outcome_model(load_draft_picks(), digest)
+    path = artifact_path(digest)
+    save_outcome_model(model, path)
+    print(f"Saved outcome model to {path}")
@@ -3,24 +3,16 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import base64
-import os
+from draft_data import (add_surplus_value, team_surplus, apply_position_scheme, add_franchise, franchise_logo_path,
+                        last_complete_season, FRANCHISE_NAMES, FRANCHISES, COMPLETE_CAREER_SEASONS)
+from outcome_model import scored_draft_picks, OUTCOMES
+from lean_render import lean_render_enabled, show_chart, payload_report
+from precompute import prefetch, view_result
 
 # Paths
 LOGO_DIR = "logos/teams"
 
-# Team name and color mapping
-TEAM_NAMES = {
-    "ARI": "Arizona Cardinals", "ATL": "Atlanta Falcons", "BAL": "Baltimore Ravens", "BUF": "Buffalo Bills",
-    "CAR": "Carolina Panthers", "CHI": "Chicago Bears", "CIN": "Cincinnati Bengals", "CLE": "Cleveland Browns",
-    "DAL": "Dallas Cowboys", "DEN": "Denver Broncos", "DET": "Detroit Lions", "GNB": "Green Bay Packers",
-    "HOU": "Houston Texans", "IND": "Indianapolis Colts", "JAX": "Jacksonville Jaguars", "KAN": "Kansas City Chiefs",
-    "LAC": "Los Angeles Chargers", "LAR": "Los Angeles Rams", "MIA": "Miami Dolphins", "MIN": "Minnesota Vikings",
-    "NWE": "New England Patriots", "NOR": "New Orleans Saints", "NYG": "New York Giants", "NYJ": "New York Jets",
-    "OAK": "Oakland Raiders", "LVR": "Las Vegas Raiders", "PHI": "Philadelphia Eagles", "PIT": "Pittsburgh Steelers",
-    "SEA": "Seattle Seahawks", "SFO": "San Francisco 49ers", "TAM": "Tampa Bay Buccaneers",
-    "TEN": "Tennessee Titans", "WAS": "Washington Commanders"
-}
-
+# Team color mapping
 TEAM_COLORS = {
     "ARI": "#97233F", "ATL": "#A71930", "BAL": "#241773", "BUF": "#00338D", "CAR": "#0085CA",
     "CHI": "#C83803", "CIN": "#FB4F14", "CLE": "#FF3C00", "DAL": "#003594", "DEN": "#FB4F14",
@@ -34,46 +26,104 @@ TEAM_COLORS = {
 # Load data
 df = pd.read_csv("draft_picks.csv")
 df = df[df["round"] > 0]
+df = add_franchise(df)
 
-# Compute impact score and context score
+# Compute impact score and surplus value over the expected W_AV for each pick
 df["impact_score"] = df["w_av"] + (5 * df["allpro"] + 2 * df["probowls"])
-df["w_av_context"] = df["w_av"] * (1 + (df["round"] / 10))
+df = add_surplus_value(df)
 df["recognition"] = df["allpro"] + df["probowls"] > 0
+df["position_group"] = apply_position_scheme(df["position"], "Grouped")
+try:
+    df = df.join(scored_draft_picks())
+except FileNotFoundError as error:
+    st.error(str(error))
+    st.stop()
 
 # Statistics Summary
-def generate_stat_summary(row):
-    pos = row["position"]
-    parts = []
+STAT_LABELS = {
+    "pass_yards": "Pass Yards", "pass_tds": "Pass TDs", "rush_yards": "Rush Yards", "rush_tds": "Rush TDs",
+    "rec_yards": "Rec Yards", "rec_tds": "Rec TDs", "def_sacks": "Sacks", "def_solo_tackles": "Solo Tackles",
+    "def_ints": "INT"
+}
+
+# Stats shown for each grouped position (see POSITION_GROUPS in draft_data)
+POSITION_STATS = {
+    "QB": ["pass_yards", "pass_tds", "rush_yards", "rush_tds"],
+    "RB": ["rush_yards", "rush_tds", "rec_yards", "rec_tds"],
+    "FB": ["rush_yards", "rush_tds", "rec_yards", "rec_tds"],
+    "WR": ["rec_yards", "rec_tds"],
+    "TE": ["rec_yards", "rec_tds"],
+    "DL": ["def_sacks", "def_solo_tackles"],
+    "DE": ["def_sacks", "def_solo_tackles"],
+    "LB": ["def_solo_tackles", "def_sacks", "def_ints"],
+    "DB": ["def_ints", "def_solo_tackles"]
+}
 
+def generate_stat_summary(row):
     def safe_val(val):
         return 0 if pd.isna(val) else int(val)
 
-    if pos == "QB":
-        parts = [f"Pass Yards: {safe_val(row['pass_yards'])}", f"Pass TDs: {safe_val(row['pass_tds'])}",
-                 f"Rush Yards: {safe_val(row['rush_yards'])}", f"Rush TDs: {safe_val(row['rush_tds'])}"]
-    elif pos in ["RB", "FB"]:
-        parts = [f"Rush Yards: {safe_val(row['rush_yards'])}", f"Rush TDs: {safe_val(row['rush_tds'])}",
-                 f"Rec Yards: {safe_val(row['rec_yards'])}", f"Rec TDs: {safe_val(row['rec_tds'])}"]
-    elif pos in ["WR", "TE"]:
-        parts = [f"Rec Yards: {safe_val(row['rec_yards'])}", f"Rec TDs: {safe_val(row['rec_tds'])}"]
-    elif pos in ["DL", "DE", "DT", "EDGE"]:
-        parts = [f"Sacks: {safe_val(row['def_sacks'])}", f"Solo Tackles: {safe_val(row['def_solo_tackles'])}"]
-    elif pos == "LB":
-        parts = [f"Solo Tackles: {safe_val(row['def_solo_tackles'])}", f"Sacks: {safe_val(row['def_sacks'])}", f"INT: {safe_val(row['def_ints'])}"]
-    elif pos in ["CB", "S", "DB"]:
-        parts = [f"INT: {safe_val(row['def_ints'])}", f"Solo Tackles: {safe_val(row['def_solo_tackles'])}"]
-
-    return " | ".join(parts)
+    stats = POSITION_STATS.get(row["position_group"], [])
+    return " | ".join(f"{STAT_LABELS[stat]}: {safe_val(row[stat])}" for stat in stats)
+
+# Draft Grade Calculation: (minimum score, letter grade, badge color)
+GRADE_SCALE = [(90, "A+", "#4CAF50"), (80, "A", "#4CAF50"), (65, "B", "#66BB6A"), (50, "C", "#FFB300"), (35, "D", "#FF9800")]
+
+def draft_grade(draft_score):
+    for minimum, letter, color in GRADE_SCALE:
+        if draft_score >= minimum:
+            return letter, color
+    return "F", "#B71C1C"
+
+def grade_badge(letter_grade, draft_score, grade_color):
+    return f"""
+        <div style='margin-top: 0.5em;'>
+            <div style='display: inline-block; padding: 0.4em 1.2em; background-color: {grade_color}; color: white;
+                        border-radius: 10px; font-size: 16px; font-weight: bold;'>
+                Draft Grade: {letter_grade} ({draft_score:.0f})
+            </div>
+        </div>
+    """
+
+# Per-franchise draft metrics for any number of teams in one grouped pass
+def team_summaries(df, franchise_ids):
+    df = df[df["franchise_id"].isin(franchise_ids)]
+    summary = df.groupby("franchise_id").agg(
+        players=("impact_score", "size"),
+        avg_wav=("w_av", "mean"),
+        total_impact=("impact_score", "sum"),
+        avg_round=("round", "mean"),
+        first_season=("season", "min"),
+        top_index=("impact_score", "idxmax")
+    )
+
+    years_since_draft = (2024 - summary["first_season"]).clip(lower=1)
+    recency_scale = (4 / years_since_draft).clip(upper=2.0)
+    raw_score = 100 * (summary["total_impact"] * recency_scale / (summary["players"] * 15))
+    penalty = (summary["avg_round"] - 1) / 20
+    summary["draft_score"] = (raw_score * (1 - penalty)).clip(upper=100)
+    summary["top_player"] = df.loc[summary["top_index"], "pfr_player_name"].to_numpy()
+    summary["team"] = summary.index.map(lambda franchise_id: FRANCHISES[franchise_id])
+    return summary.drop(columns=["top_index"])
 
 # Page config
 st.set_page_config(page_title="Team Overview", layout="wide")
 st.markdown("<style>section[data-testid='stSidebar'] div.stButton > button { width: 100%; }</style>", unsafe_allow_html=True)
 
 # Sidebar
-abbrev_to_full = {k: v for k, v in TEAM_NAMES.items() if k in df["team"].unique()}
+abbrev_to_full = {k: v for k, v in FRANCHISE_NAMES.items() if k in df["franchise"].unique()}
 full_to_abbrev = {v: k for k, v in abbrev_to_full.items()}
-selected_team_name = st.sidebar.selectbox("Select a Team", sorted(full_to_abbrev.keys()))
-selected_team = full_to_abbrev[selected_team_name]
+compare_mode = st.sidebar.radio("Mode", ["Single Team", "Compare Teams"], horizontal=True) == "Compare Teams"
+if compare_mode:
+    team_options = sorted(full_to_abbrev.keys())
+    compare_names = st.sidebar.multiselect("Select Teams", team_options, default=team_options[:2])
+    if st.sidebar.checkbox("All teams"):
+        compare_names = team_options
+    compare_ids = [FRANCHISES.index(full_to_abbrev[name]) for name in compare_names]
+else:
+    selected_team_name = st.sidebar.selectbox("Select a Team", sorted(full_to_abbrev.keys()))
+    selected_team = full_to_abbrev[selected_team_name]
+    selected_franchise_id = FRANCHISES.index(selected_team)
 
 st.sidebar.markdown("**Select Draft Year(s)**")
 year_list = list(range(2024, 2010 - 1, -1))
@@ -86,80 +136,114 @@ if not selected_years:
     st.sidebar.error("Please select at least one year.")
     st.stop()
 
+lean_render = lean_render_enabled()
+
 # Filter data
 df_filtered = df[df["season"].isin(selected_years)]
+
+# Team Comparison
+if compare_mode:
+    if len(compare_ids) < 2:
+        st.sidebar.error("Please select at least two teams to compare.")
+        st.stop()
+
+    summaries = team_summaries(df_filtered, compare_ids).sort_values("draft_score", ascending=False)
+    st.markdown("<h1 style='margin-bottom: 0;'>Team Draft Comparison</h1>", unsafe_allow_html=True)
+
+    # Side-by-side cards when there is room, always followed by the full table
+    if len(summaries) <= 4:
+        for col, (_, row) in zip(st.columns(len(summaries)), summaries.iterrows()):
+            with col:
+                letter_grade, grade_color = draft_grade(row["draft_score"])
+                st.image(franchise_logo_path(row["team"], LOGO_DIR), width=80)
+                st.markdown(f"**{FRANCHISE_NAMES[row['team']]}**")
+                st.markdown(grade_badge(letter_grade, row["draft_score"], grade_color), unsafe_allow_html=True)
+                st.metric("Players Drafted", int(row["players"]))
+                st.metric("Avg Weighted Approximate Value", round(row["avg_wav"], 1))
+                st.metric("Total Impact Score", round(row["total_impact"], 1))
+                st.metric("Top Impact Player", row["top_player"])
+
+    st.markdown("---")
+    chart_col, table_col = st.columns(2)
+    with chart_col:
+        st.markdown("### Draft Score")
+        fig_compare = px.bar(summaries, x="team", y="draft_score", color="team",
+                             color_discrete_map=TEAM_COLORS)
+        fig_compare.update_layout(xaxis_title="Team", yaxis_title="Draft Score", showlegend=False, height=450)
+        show_chart(fig_compare, "team_comparison", lean=lean_render)
+    with table_col:
+        st.markdown("### Side-by-Side Metrics")
+        df_compare = pd.DataFrame({
+            "Team": summaries["team"].map(FRANCHISE_NAMES),
+            "Grade": summaries["draft_score"].map(lambda score: draft_grade(score)[0]),
+            "Draft Score": summaries["draft_score"].round(0),
+            "Players Drafted": summaries["players"],
+            "Avg W_AV": summaries["avg_wav"].round(1),
+            "Total Impact": summaries["total_impact"].round(1),
+            "Top Impact Player": summaries["top_player"]
+        })
+        st.dataframe(df_compare, use_container_width=True, hide_index=True, height=450)
+
+    payload_report()
+    st.stop()
+
 team_color = TEAM_COLORS.get(selected_team, "#888")
-team_logo_path = os.path.join("logos/teams", f"{selected_team}.png")
-
-# Filter team data
-df_team = df_filtered[df_filtered["team"] == selected_team].copy()
-df_team["total_yards"] = df_team[["rush_yards", "rec_yards", "pass_yards"]].fillna(0).sum(axis=1)
-df_team["defense_impact"] = df_team[["def_solo_tackles", "def_sacks", "def_ints"]].fillna(0).sum(axis=1)
-df_team["impact"] = df_team["impact_score"]
-df_team["stat_summary"] = df_team.apply(generate_stat_summary, axis=1)
-
-# Draft Grade Calculation
-total_impact = df_team["impact_score"].sum()
-num_players = len(df_team)
-avg_round = df_team["round"].mean()
-
-if num_players > 0:
-    years_since_draft = max(1, 2024 - df_team["season"].min())
-    recency_scale = min(2.0, 4 / years_since_draft)
-    adjusted_impact_score = df_team["impact_score"] * recency_scale
-    total_impact = adjusted_impact_score.sum()
-
-    raw_score = 100 * (total_impact / (num_players * 15))
-    penalty = (avg_round - 1) / 20
-    draft_score = raw_score * (1 - penalty)
-    draft_score = min(draft_score, 100)
-else:
-    draft_score = 0
-
-if draft_score >= 90:
-    letter_grade = "A+"
-elif draft_score >= 80:
-    letter_grade = "A"
-elif draft_score >= 65:
-    letter_grade = "B"
-elif draft_score >= 50:
-    letter_grade = "C"
-elif draft_score >= 35:
-    letter_grade = "D"
-else:
-    letter_grade = "F"
-
-if draft_score >= 80:
-    grade_color = "#4CAF50"
-elif draft_score >= 65:
-    grade_color = "#66BB6A"
-elif draft_score >= 50:
-    grade_color = "#FFB300"
-elif draft_score >= 35:
-    grade_color = "#FF9800"
-else:
-    grade_color = "#B71C1C"
+team_logo_path = franchise_logo_path(selected_team, LOGO_DIR)
+
+# Filter team data (built on the precompute queue, shared across sessions)
+def build_team_view(df_team):
+    df_team = df_team.copy()
+    df_team["total_yards"] = df_team[["rush_yards", "rec_yards", "pass_yards"]].fillna(0).sum(axis=1)
+    df_team["defense_impact"] = df_team[["def_solo_tackles", "def_sacks", "def_ints"]].fillna(0).sum(axis=1)
+    df_team["impact"] = df_team["impact_score"]
+    df_team["stat_summary"] = df_team.apply(generate_stat_summary, axis=1)
+    return df_team
+
+def team_view_request(franchise_id, years):
+    df_years = df_filtered if years == selected_years else df[df["season"].isin(years)]
+    return (("team_view", franchise_id, tuple(sorted(years))), build_team_view,
+            df_years[df_years["franchise_id"] == franchise_id])
+
+df_team = view_result(*team_view_request(selected_franchise_id, selected_years), message="Loading draft picks...").copy()
+
+# Speculatively prepare the likely next views: neighbouring teams in the list and one more adjacent season
+team_options = sorted(full_to_abbrev.keys())
+team_position = team_options.index(selected_team_name)
+neighbour_ids = [FRANCHISES.index(full_to_abbrev[team_options[i]])
+                 for i in (team_position - 1, team_position + 1) if 0 <= i < len(team_options)]
+adjacent_years = [sorted(selected_years + [year]) for year in (min(selected_years) - 1, max(selected_years) + 1)
+                  if year in year_list]
+prefetch(*[team_view_request(franchise_id, selected_years) for franchise_id in neighbour_ids],
+         *[team_view_request(selected_franchise_id, years) for years in adjacent_years])
+
+# Draft Grade
+team_summary = team_summaries(df_filtered, [selected_franchise_id])
+draft_score = team_summary["draft_score"].iloc[0] if len(team_summary) else 0
+letter_grade, grade_color = draft_grade(draft_score)
 
 # Team Title and Metrics Row
 st.markdown(f"<h1 style='margin-bottom: 0;'>Team Draft Performance: {selected_team_name}</h1>", unsafe_allow_html=True)
 
-col0, col1, col2, col3 = st.columns([1, 1, 1, 2])
+col0, col1, col2, col3, col4 = st.columns([1, 1, 1, 1, 2])
 with col0:
     st.image(team_logo_path, width=80)
-    st.markdown(f"""
-        <div style='margin-top: 0.5em;'>
-            <div style='display: inline-block; padding: 0.4em 1.2em; background-color: {grade_color}; color: white;
-                        border-radius: 10px; font-size: 16px; font-weight: bold;'>
-                Draft Grade: {letter_grade} ({draft_score:.0f})
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(grade_badge(letter_grade, draft_score, grade_color), unsafe_allow_html=True)
 
 with col1:
     st.metric("Players Drafted", len(df_team))
 with col2:
     st.metric("Avg Weighted Approximate Value", round(df_team["w_av"].mean(), 1))
 with col3:
+    league_surplus = team_surplus(df_filtered).sort_values("total_surplus", ascending=False).reset_index(drop=True)
+    team_rank = league_surplus.index[league_surplus["franchise_id"] == selected_franchise_id]
+    team_total_surplus = df_team["surplus_wav"].sum(min_count=1)
+    st.metric(
+        "Surplus W_AV vs. Pick", f"{team_total_surplus:+.1f}" if pd.notnull(team_total_surplus) else "N/A",
+        help=(f"Ranks {team_rank[0] + 1} of {len(league_surplus)} teams. " if len(team_rank) else "")
+             + "Actual W_AV minus the expected W_AV for each player's draft slot. "
+             + f"Drafts from the last {COMPLETE_CAREER_SEASONS} seasons are still accruing value and are left out."
+    )
+with col4:
     top_player = df_team.loc[df_team["impact_score"].idxmax()]
     st.metric("Top Impact Player", f"{top_player['pfr_player_name']}")
 
@@ -178,7 +262,7 @@ with chart_col:
         xaxis_title="Player", yaxis_title="Impact Score",
         height=450
     )
-    st.plotly_chart(fig_top, use_container_width=True)
+    show_chart(fig_top, "team_top_impact", lean=lean_render)
 
 with table_col:
     st.markdown("""
@@ -192,6 +276,46 @@ with table_col:
     st.markdown("### Top Statistical Performers")
     df_team["Pro-Bowl/All-Pro"] = df_team["recognition"].apply(lambda x: "✓" if x else "✗")
     df_table = df_team.sort_values("impact", ascending=False).head(10)
-    df_table = df_table[["impact", "season", "pfr_player_name", "position", "games", "Pro-Bowl/All-Pro", "stat_summary"]]
-    df_table.rename(columns={"stat_summary": "Stats"}, inplace=True)
+    df_table = df_table.assign(
+        surplus_wav=df_table["surplus_wav"].map(lambda v: f"{v:+.1f}" if pd.notnull(v) else "N/A")
+    )
+    df_table = df_table[["impact", "season", "pfr_player_name", "position", "games", "surplus_wav", "Pro-Bowl/All-Pro", "stat_summary"]]
+    df_table.rename(columns={"stat_summary": "Stats", "surplus_wav": "Surplus W_AV"}, inplace=True)
     st.dataframe(df_table, use_container_width=True, height=450)
+
+# Predicted vs. Actual Outcomes
+st.markdown("---")
+st.markdown("### Predicted vs. Actual Career Outcomes")
+st.caption("Probabilities from the career-outcome model (pick, position and combine metrics), "
+           f"next to what each player actually achieved. Starter means {OUTCOMES['starter'][1]}+ seasons started. "
+           f"Players drafted in the last {COMPLETE_CAREER_SEASONS} seasons who have not reached an outcome yet "
+           "are shown as Pending.")
+df_outcomes = df_team.sort_values(["season", "pick"])
+
+
+def outcome_marks(outcome):
+    col, threshold = OUTCOMES[outcome]
+    reached = df_outcomes[col].fillna(0) >= threshold
+    pending = ~reached & (df_outcomes["season"] > last_complete_season())
+    return reached.map({True: "✓", False: "✗"}).mask(pending, "Pending")
+
+
+df_outcomes = pd.DataFrame({
+    "Season": df_outcomes["season"],
+    "Pick": df_outcomes["pick"].astype(int),
+    "Player": df_outcomes["pfr_player_name"],
+    "Position": df_outcomes["position"],
+    "P(Starter)": (100 * df_outcomes["p_starter"]).round(0),
+    "Starter": outcome_marks("starter"),
+    "P(Pro Bowl)": (100 * df_outcomes["p_pro_bowl"]).round(0),
+    "Pro Bowl": outcome_marks("pro_bowl")
+})
+st.dataframe(
+    df_outcomes, use_container_width=True, hide_index=True,
+    column_config={
+        "P(Starter)": st.column_config.ProgressColumn("P(Starter)", format="%d%%", min_value=0, max_value=100),
+        "P(Pro Bowl)": st.column_config.ProgressColumn("P(Pro Bowl)", format="%d%%", min_value=0, max_value=100)
+    }
+)
+
+payload_report()
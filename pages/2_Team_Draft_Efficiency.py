@@ -1,9 +1,12 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
 import os
 from PIL import Image
+from draft_data import add_franchise, franchise_logo_path, FRANCHISES
+from lean_render import lean_render_enabled, show_chart, payload_report
+from precompute import prefetch, view_result
 
 # -Page Config
 st.set_page_config(page_title="Team Draft Efficiency", layout="wide")
@@ -16,13 +19,17 @@ df = df[(df["round"] > 0) & (df["round"] <= 6)]
 st.sidebar.header("Filters")
 years = list(range(2024, 2010 - 1, -1))
 
-selected_year = st.sidebar.selectbox("Year", years, index=years.index(2019))
+view_mode = st.sidebar.radio("View", ["Single Season", "All Seasons (Animated)"])
+if view_mode == "Single Season":
+    selected_year = st.sidebar.selectbox("Year", years, index=years.index(2019))
+show_intervals = st.sidebar.checkbox("Show 95% bootstrap intervals", value=False)
+lean_render = lean_render_enabled()
 
-df = df[df["season"] == selected_year]
+df = df[df["season"].isin(years)]
 
-# Map logos
+# Map logos by franchise so relocated teams keep a single point
 logo_dir = "logos/teams"
-team_logos = {f.split(".")[0]: os.path.join(logo_dir, f) for f in os.listdir(logo_dir) if f.endswith(".png")}
+team_logos = {franchise: franchise_logo_path(franchise, logo_dir) for franchise in FRANCHISES}
 
 # Cache images to try to increase loading times
 @st.cache_resource
@@ -30,67 +37,204 @@ def load_logo_images(team_logos):
     return {team: Image.open(path) for team, path in team_logos.items() if os.path.exists(path)}
 
 logo_images = load_logo_images(team_logos)
+df = add_franchise(df)
+df = df.assign(team=df["franchise"])
 df = df[df["team"].isin(logo_images.keys())]
 
-# Compute averages
-team_stats = df.groupby("team").agg(avg_round=("round", "mean"), avg_wav=("w_av", "mean")).reset_index()
-team_stats = team_stats[team_stats["team"].isin(logo_images.keys())]
-team_stats["logo_img"] = team_stats["team"].map(logo_images)
+# Per-season team averages and hover text, computed once for every season
+@st.cache_data
+def compute_season_stats(df):
+    def fmt(col):
+        return df[col].map(lambda v: str(int(v)) if pd.notnull(v) else "N/A")
+
+    pick_text = (df["pfr_player_name"].astype(str) + ": Pick " + fmt("pick") + ", Round " + fmt("round")
+                 + ", W_AV " + fmt("w_av"))
+    grouped = pick_text.groupby([df["season"], df["team"]])
+    season_stats = df.groupby(["season", "team"]).agg(avg_round=("round", "mean"), avg_wav=("w_av", "mean"))
+    season_stats["hover_text"] = grouped.agg("<br>".join)
+    return season_stats.reset_index()
+
+season_stats = compute_season_stats(df)
+
+# Bootstrap intervals for every team in a season at once
+N_BOOTSTRAP = 2000
+
+def bootstrap_team_intervals(season_df, n_boot=N_BOOTSTRAP, ci=0.95, seed=760):
+    codes, teams = pd.factorize(season_df["team"], sort=True)
+    counts = np.bincount(codes)
+    order = np.argsort(codes, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    # Resample each team's picks with replacement: (n_boot, n_teams, max_picks) row indices,
+    # padded past each team's pick count and masked out below
+    rng = np.random.default_rng(seed)
+    draws = (rng.random((n_boot, len(teams), counts.max())) * counts[:, None]).astype(np.int64)
+    rows = order[offsets[:, None] + draws]
+    in_team = np.arange(counts.max()) < counts[:, None]
+
+    alpha = (1 - ci) / 2 * 100
+    intervals = pd.DataFrame({"team": teams})
+    for col, name in [("round", "round"), ("w_av", "wav")]:
+        values = season_df[col].to_numpy(dtype=float)[rows]
+        keep = in_team & ~np.isnan(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(keep, values, 0).sum(axis=-1) / keep.sum(axis=-1)
+        intervals[f"{name}_lo"], intervals[f"{name}_hi"] = np.nanpercentile(means, [alpha, 100 - alpha], axis=0)
+    return intervals
+
+# Intervals are computed on the background precompute queue and cached there per season
+def bootstrap_request(season):
+    return ("bootstrap_intervals", season), bootstrap_team_intervals, df[df["season"] == season]
+
+def to_coords(values):
+    return [None if pd.isna(v) else round(float(v), 3) for v in np.atleast_1d(values)]
+
+def interval_error_bars(stats):
+    if not show_intervals:
+        return {}
+    season = stats["season"].dropna().iloc[0]
+    intervals = view_result(*bootstrap_request(season), message="Resampling team picks...")
+    stats = stats[["team", "avg_round", "avg_wav"]].merge(intervals, on="team", how="left")
+
+    def error_bars(center, lo, hi):
+        return dict(type="data", symmetric=False, array=to_coords(stats[hi] - stats[center]),
+                    arrayminus=to_coords(stats[center] - stats[lo]),
+                    color="rgba(229, 231, 235, 0.45)", thickness=1.5, width=0)
+
+    return dict(error_x=error_bars("avg_round", "round_lo", "round_hi"),
+                error_y=error_bars("avg_wav", "wav_lo", "wav_hi"))
 
 # Create quadrants and limit to 6 rounds
 x_range = [1, 6]
-y_range = [0, team_stats["avg_wav"].max() * 1.1]
 x_mid = sum(x_range) / 2
-y_mid = sum(y_range) / 2
-
-# Scatter plot
-fig = px.scatter(
-    team_stats,
-    x="avg_round",
-    y="avg_wav",
-    title=f"NFL Draft Efficiency by Team ({selected_year})",
-    labels={"avg_round": "Average Draft Round", "avg_wav": "Average Weighted AV"},
-    template="plotly_dark",
-    opacity=0
-)
 
-# Add logos
-for _, row in team_stats.iterrows():
-    picks = df[df["team"] == row["team"]]
-    hover_text = "<br>".join([
-        f"{r['pfr_player_name']}: Pick {int(r['pick']) if pd.notnull(r['pick']) else 'N/A'}, "
-        f"Round {int(r['round']) if pd.notnull(r['round']) else 'N/A'}, "
-        f"W_AV {int(r['w_av']) if pd.notnull(r['w_av']) else 'N/A'}"
-        for _, r in picks.iterrows()
-    ])
-    
-    fig.add_trace(
-        go.Scatter(
-            x=[row["avg_round"]],
-            y=[row["avg_wav"]],
-            mode="markers",
+if view_mode == "Single Season":
+    # Queue this season first, then the neighbouring ones to have them ready for the next selection
+    if show_intervals:
+        prefetch(*[bootstrap_request(season) for season in (selected_year, selected_year - 1, selected_year + 1)
+                   if season in years])
+
+    team_stats = season_stats[season_stats["season"] == selected_year]
+    team_stats = team_stats.assign(logo_img=team_stats["team"].map(logo_images))
+    y_range = [0, team_stats["avg_wav"].max() * 1.1]
+    y_mid = sum(y_range) / 2
+
+    # One WebGL trace carries every team's hover text; logos (or team labels in lean mode) mark the points
+    fig = go.Figure(
+        data=[go.Scattergl(
+            x=team_stats["avg_round"],
+            y=team_stats["avg_wav"],
+            mode="text" if lean_render else "markers",
+            text=team_stats["team"] if lean_render else None,
             marker=dict(opacity=0),
-            hovertext=hover_text,
+            hovertext=team_stats["hover_text"],
             hoverinfo="text",
-            showlegend=False
-        )
+            showlegend=False,
+            **interval_error_bars(team_stats)
+        )],
+        layout=go.Layout(template="plotly_dark", title=f"NFL Draft Efficiency by Team ({selected_year})")
     )
 
-    fig.add_layout_image(
-        dict(
-            source=row["logo_img"],
-            x=row["avg_round"],
-            y=row["avg_wav"],
-            xref="x",
-            yref="y",
-            sizex=0.35,
-            sizey=(y_range[1] - y_range[0]) * 0.05,
-            xanchor="center",
-            yanchor="middle",
-            sizing="contain",
-            layer="above",
-            name=row["team"]
-        )
+    # Add logos
+    if not lean_render:
+        for _, row in team_stats.iterrows():
+            fig.add_layout_image(
+                dict(
+                    source=row["logo_img"],
+                    x=row["avg_round"],
+                    y=row["avg_wav"],
+                    xref="x",
+                    yref="y",
+                    sizex=0.35,
+                    sizey=(y_range[1] - y_range[0]) * 0.05,
+                    xanchor="center",
+                    yanchor="middle",
+                    sizing="contain",
+                    layer="above",
+                    name=row["team"]
+                )
+            )
+else:
+    # Fixed axes across every season so the frames only move points
+    seasons = sorted(season_stats["season"].unique())
+    teams = sorted(season_stats["team"].unique())
+    y_range = [0, season_stats["avg_wav"].max() * 1.1]
+    y_mid = sum(y_range) / 2
+
+    # Queue every season up front so the workers resample them in parallel
+    if show_intervals:
+        prefetch(*[bootstrap_request(season) for season in seasons])
+
+    season_grid = season_stats.set_index(["season", "team"]).reindex(pd.MultiIndex.from_product([seasons, teams]))
+
+    def season_coords(season):
+        frame_stats = season_grid.loc[season].rename_axis("team").reset_index().assign(season=season)
+        x = to_coords(frame_stats["avg_round"])
+        y = to_coords(frame_stats["avg_wav"])
+        hover = frame_stats["hover_text"].fillna("").tolist()
+        return x, y, hover, interval_error_bars(frame_stats)
+
+    def season_images(x, y):
+        # Logos live once in the template; each frame only references them by name
+        return [dict(templateitemname=team, x=xi, y=yi, visible=xi is not None)
+                for team, xi, yi in zip(teams, x, y)]
+
+    x0, y0, hover0, errors0 = season_coords(seasons[0])
+    fig = go.Figure(
+        data=[go.Scattergl(x=x0, y=y0, mode="text" if lean_render else "markers", text=teams if lean_render else None,
+                           marker=dict(opacity=0), hovertext=hover0, hoverinfo="text", showlegend=False, **errors0)],
+        layout=go.Layout(template="plotly_dark", title="NFL Draft Efficiency by Team (2010-2024)",
+                         xaxis=dict(range=[x_range[0] - 0.25, x_range[1] + 0.25]), yaxis=dict(range=y_range))
+    )
+    if not lean_render:
+        fig.layout.template.layout.images = [
+            dict(
+                name=team,
+                source=logo_images[team],
+                xref="x",
+                yref="y",
+                sizex=0.35,
+                sizey=(y_range[1] - y_range[0]) * 0.05,
+                xanchor="center",
+                yanchor="middle",
+                sizing="contain",
+                layer="above"
+            )
+            for team in teams
+        ]
+        fig.update_layout(images=season_images(x0, y0))
+
+    frames = []
+    for season in seasons:
+        x, y, hover, errors = season_coords(season)
+        frames.append(go.Frame(
+            name=str(season),
+            data=[go.Scattergl(x=x, y=y, hovertext=hover, **errors)],
+            traces=[0],
+            layout=None if lean_render else go.Layout(images=season_images(x, y))
+        ))
+    fig.frames = frames
+
+    frame_args = {"frame": {"duration": 600, "redraw": True}, "mode": "immediate", "transition": {"duration": 300}}
+    fig.update_layout(
+        updatemenus=[dict(
+            type="buttons",
+            direction="left",
+            x=0, y=-0.08, xanchor="left", yanchor="top",
+            buttons=[
+                dict(label="Play", method="animate", args=[None, {**frame_args, "fromcurrent": True}]),
+                dict(label="Pause", method="animate",
+                     args=[[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate"}])
+            ]
+        )],
+        sliders=[dict(
+            active=0,
+            x=0.1, y=-0.08, len=0.9, xanchor="left", yanchor="top",
+            currentvalue=dict(prefix="Season: "),
+            steps=[dict(label=str(season), method="animate",
+                        args=[[str(season)], {**frame_args, "transition": {"duration": 0}}])
+                   for season in seasons]
+        )]
     )
 
 # Quadrants lines
@@ -113,11 +257,12 @@ fig.update_layout(
     paper_bgcolor="#111827",
     font_color="#E5E7EB",
     height=700,
-    margin=dict(l=40, r=40, t=60, b=40),
+    margin=dict(l=40, r=40, t=60, b=40 if view_mode == "Single Season" else 120),
     showlegend=False
 )
 
 # Final output
 st.markdown("## Team Draft Efficiency")
 st.markdown("Each team’s draft efficiency is shown by average round vs. weighted career value (W_AV).")
-st.plotly_chart(fig, use_container_width=True)
+show_chart(fig, "efficiency" if view_mode == "Single Season" else "efficiency_animated", lean=lean_render)
+payload_report()
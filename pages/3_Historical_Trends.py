@@ -0,0 +1,104 @@
+import streamlit as st
+import plotly.express as px
+from draft_data import (grouped_position_round_counts, season_conference_counts, season_round_wav, rolling_sum,
+                        POSITION_SCHEMES)
+from lean_render import lean_render_enabled, show_chart, payload_report
+
+# Page config
+st.set_page_config(page_title="Historical Draft Trends", layout="wide")
+
+# Color scheme
+ACCENT_COLOR = "#dc2626"
+BACKGROUND_COLOR = "#0F172A"
+TEXT_COLOR = "#F1F5F9"
+
+# Header
+st.markdown(
+    f"""
+    <div style="background-color:{BACKGROUND_COLOR}; padding:2rem 2rem 1.5rem 2rem; border-left:8px solid {ACCENT_COLOR}; margin-bottom:2rem;">
+        <h1 style="color:{TEXT_COLOR}; font-size:2.25rem; margin:0 0 0.25rem 0;">Historical Draft Trends</h1>
+        <p style="color:{TEXT_COLOR}; font-size:1.05rem; margin:0;">
+            How positions, conferences and draft value have shifted since 1980.
+        </p>
+    </div>
+    """,
+    unsafe_allow_html=True
+)
+
+# Sidebar
+position_scheme = st.sidebar.radio("Position Grouping", POSITION_SCHEMES, index=1)
+
+# Per-season aggregates (cached); everything below works on these small tables, never the raw picks
+position_counts = grouped_position_round_counts(position_scheme)
+conference_counts = season_conference_counts()
+wav_sums, wav_counts = season_round_wav()
+
+first_season, last_season = int(position_counts["season"].min()), int(position_counts["season"].max())
+season_range = st.sidebar.slider("Seasons", first_season, last_season, (first_season, last_season))
+window = st.sidebar.slider("Rolling window (seasons)", 1, 10, 3)
+lean_render = lean_render_enabled()
+
+
+def rolling_share(wide):
+    rolled = rolling_sum(wide, window)
+    shares = rolled.div(rolled.sum(axis=1).where(lambda total: total > 0), axis=0)
+    return shares.loc[season_range[0]:season_range[1]]
+
+
+def long_form(wide, value_name):
+    return wide.rename_axis(index="season", columns="category").stack().reset_index(name=value_name)
+
+
+def style(fig):
+    fig.update_layout(font_color=TEXT_COLOR, plot_bgcolor=BACKGROUND_COLOR, paper_bgcolor=BACKGROUND_COLOR,
+                      legend_title_text="", height=450)
+    return fig
+
+
+drafted = position_counts[position_counts["round"] > 0]
+position_wide = drafted.pivot_table(index="season", columns="position", values="count", aggfunc="sum",
+                                    fill_value=0, observed=True)
+round1_wide = drafted[drafted["round"] == 1].pivot_table(index="season", columns="position", values="count",
+                                                         aggfunc="sum", fill_value=0, observed=True)
+
+window_label = f"{window}-season rolling" if window > 1 else "per season"
+
+# Position Share
+st.subheader("Position Share")
+left_col, right_col = st.columns(2)
+with left_col:
+    fig_pos = px.area(long_form(rolling_share(position_wide), "share"), x="season", y="share", color="category",
+                      title=f"Share of Picks by Position ({window_label})")
+    fig_pos.update_yaxes(tickformat=".0%")
+    show_chart(style(fig_pos), "trend_position_share", lean=lean_render)
+
+with right_col:
+    fig_round1 = px.area(long_form(rolling_share(round1_wide), "share"), x="season", y="share", color="category",
+                         title=f"Round 1 Position Mix ({window_label})")
+    fig_round1.update_yaxes(tickformat=".0%")
+    show_chart(style(fig_round1), "trend_round1_mix", lean=lean_render)
+
+# Conferences and Value
+st.markdown("---")
+left_col, right_col = st.columns(2)
+with left_col:
+    st.subheader("Conference Share")
+    fig_conf = px.line(long_form(rolling_share(conference_counts), "share"), x="season", y="share", color="category",
+                       title=f"Share of Picks by Conference ({window_label})")
+    fig_conf.update_yaxes(tickformat=".0%")
+    show_chart(style(fig_conf), "trend_conference_share", lean=lean_render)
+
+with right_col:
+    st.subheader("Average W_AV by Round")
+    avg_wav = rolling_sum(wav_sums, window) / rolling_sum(wav_counts, window).where(lambda count: count > 0)
+    # Seasons without any reported W_AV stay empty instead of repeating the previous seasons' window
+    avg_wav = avg_wav.where(wav_counts.sum(axis=1) > 0, axis=0)
+    avg_wav = avg_wav.loc[season_range[0]:season_range[1]]
+    avg_wav.columns = [f"Round {int(r)}" for r in avg_wav.columns]
+    fig_wav = px.line(long_form(avg_wav, "avg_wav"), x="season", y="avg_wav", color="category",
+                      title=f"Average Weighted AV by Round ({window_label})",
+                      labels={"avg_wav": "Average Weighted AV"})
+    show_chart(style(fig_wav), "trend_wav_by_round", lean=lean_render)
+    st.caption("Recent classes are still accumulating career value, so their W_AV is not yet comparable.")
+
+payload_report()
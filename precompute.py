@@ -0,0 +1,53 @@
+import streamlit as st
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Background precompute queue shared by every session in the process. Jobs are keyed by
+# view parameters, e.g. ("team_view", franchise_id, seasons); finished results stay in the
+# queue and act as a shared cache, and likely next views can be submitted ahead of time.
+MAX_WORKERS = 2
+MAX_RESULTS = 256
+
+
+@st.cache_resource(show_spinner=False)
+def precompute_queue():
+    return {
+        "executor": ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="precompute"),
+        "jobs": OrderedDict(),
+        "lock": threading.Lock(),
+    }
+
+
+def submit(key, fn, *args):
+    queue = precompute_queue()
+    with queue["lock"]:
+        jobs = queue["jobs"]
+        if key in jobs:
+            jobs.move_to_end(key)
+            return jobs[key]
+
+        jobs[key] = queue["executor"].submit(fn, *args)
+        # Evict the least recently used finished results
+        for old_key in [k for k, job in jobs.items() if job.done()][:max(0, len(jobs) - MAX_RESULTS)]:
+            del jobs[old_key]
+        return jobs[key]
+
+
+# Queues likely next views without waiting; each item is (key, fn, *args)
+def prefetch(*requests):
+    for key, fn, *args in requests:
+        submit(key, fn, *args)
+
+
+# Returns the result for a view: instantly if it was precomputed, otherwise behind a spinner
+def view_result(key, fn, *args, message="Preparing view..."):
+    job = submit(key, fn, *args)
+    if not job.done():
+        with st.spinner(message):
+            job.exception()
+    if job.exception() is not None:
+        queue = precompute_queue()
+        with queue["lock"]:
+            queue["jobs"].pop(key, None)  # let the next run retry
+    return job.result()
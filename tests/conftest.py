@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Pages import the shared modules from the repo root and read data with relative paths
+sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def repo_root_cwd(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
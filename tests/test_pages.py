@@ -0,0 +1,36 @@
+import os
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from conftest import REPO_ROOT
+
+
+def run_page(page):
+    return AppTest.from_file(os.path.join(REPO_ROOT, page), default_timeout=120).run()
+
+
+def test_historical_trends_page_loads():
+    at = run_page("pages/3_Historical_Trends.py")
+    assert not at.exception
+    assert len(at.get("plotly_chart")) == 4
+
+
+def test_team_overview_reports_missing_outcome_model(monkeypatch, tmp_path):
+    import outcome_model
+    monkeypatch.setattr(outcome_model, "MODEL_DIR", str(tmp_path))
+    outcome_model.load_outcome_model.clear()
+    outcome_model.scored_draft_picks.clear()
+    try:
+        at = run_page("pages/1_Team_Overview.py")
+    finally:
+        outcome_model.load_outcome_model.clear()
+        outcome_model.scored_draft_picks.clear()
+    assert not at.exception
+    assert "python outcome_model.py" in at.error[0].value
+
+
+def test_add_conference_keeps_last_listing():
+    from draft_data import add_conference
+    colleges = pd.DataFrame({"college": ["Oregon State", "Boise State", "Nowhere Tech"]})
+    assert add_conference(colleges)["conference"].tolist() == ["Pac-12", "Pac-12", "Non-Power Conference"]
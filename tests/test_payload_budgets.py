@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from conftest import REPO_ROOT
+from lean_render import PAYLOAD_BUDGETS, figure_payload_bytes, lean_figure
+
+
+def select(label, value):
+    def action(at):
+        widget = next(w for w in list(at.radio) + list(at.selectbox) if w.label == label)
+        widget.set_value(value)
+    return action
+
+
+# (page, widget changes before rendering) for every chart named in PAYLOAD_BUDGETS
+VIEWS = [
+    ("0_Landing.py", []),
+    ("0_Landing.py", [select("View by:", "Conference")]),
+    ("pages/1_Team_Overview.py", []),
+    ("pages/1_Team_Overview.py", [select("Mode", "Compare Teams")]),
+    ("pages/2_Team_Draft_Efficiency.py", []),
+    ("pages/2_Team_Draft_Efficiency.py", [select("View", "All Seasons (Animated)")]),
+    ("pages/3_Historical_Trends.py", []),
+]
+
+
+# Charts carrying float data, where lean mode must shrink the payload by rounding and narrowing
+FLOAT_CHARTS = ["position_heatmap", "pipeline_similarity", "trend_position_share", "trend_round1_mix",
+                "trend_conference_share", "trend_wav_by_round", "efficiency", "efficiency_animated"]
+
+
+def rendered_payload_sizes(page, actions, lean):
+    at = AppTest.from_file(os.path.join(REPO_ROOT, page), default_timeout=300)
+    at.session_state["lean_render"] = lean
+    at.run()
+    for action in actions:
+        action(at)
+        at.run()
+    assert not at.exception
+    return dict(at.session_state["payload_sizes"])
+
+
+def sizes_by_chart(lean):
+    sizes = {}
+    for page, actions in VIEWS:
+        for name, size in rendered_payload_sizes(page, actions, lean).items():
+            sizes[name] = max(size, sizes.get(name, 0))
+    return sizes
+
+
+@pytest.fixture(scope="module")
+def payload_sizes():
+    return sizes_by_chart(lean=True)
+
+
+@pytest.fixture(scope="module")
+def full_payload_sizes():
+    return sizes_by_chart(lean=False)
+
+
+def test_every_budgeted_chart_is_rendered(payload_sizes):
+    assert set(payload_sizes) == set(PAYLOAD_BUDGETS)
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOAD_BUDGETS))
+def test_lean_payload_within_budget(payload_sizes, name):
+    assert payload_sizes[name] <= PAYLOAD_BUDGETS[name]
+
+
+@pytest.mark.parametrize("name", FLOAT_CHARTS)
+def test_lean_payload_smaller_than_full(payload_sizes, full_payload_sizes, name):
+    assert payload_sizes[name] < full_payload_sizes[name]
+
+
+def test_lean_figure_shrinks_float_arrays():
+    values = np.random.default_rng(0).random((30, 30)) * 100
+    fig = go.Figure([go.Heatmap(z=values), go.Scatter(x=np.arange(30.0), y=values[0], customdata=values)])
+    assert figure_payload_bytes(lean_figure(fig)) < 0.6 * figure_payload_bytes(fig)